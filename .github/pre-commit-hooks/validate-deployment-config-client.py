@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Thin pre-commit client for validate-deployment-config.py --serve
+Sends the staged file list to a running validation server and falls back
+to running the validator in-process when no server is listening
+"""
+
+import json
+import os
+import runpy
+import socket
+import sys
+import tempfile
+
+VALIDATOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'validate-deployment-config.py')
+# Must match _socket_path() in validate-deployment-config.py
+SOCKET_PATH = os.path.join(
+    os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(),
+    f'sermon-validator-{os.getuid()}.sock'
+)
+# Seconds to wait on a busy or hung server before validating in-process
+TIMEOUT = 5
+
+def main():
+    """Main entry point"""
+    args = sys.argv[1:]
+    if not {'-h', '--help', '--serve'}.intersection(args):
+        request = {
+            'cwd': os.getcwd(),
+            'files': [arg for arg in args if not arg.startswith('-')],
+            'fail_fast': '--fail-fast' in args or '--fast' in args
+        }
+        try:
+            # Only trust a server run by the current user
+            if os.stat(SOCKET_PATH).st_uid != os.getuid():
+                raise PermissionError(f"{SOCKET_PATH} is owned by another user")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(TIMEOUT)
+                sock.connect(SOCKET_PATH)
+                sock.sendall(json.dumps(request).encode() + b'\n')
+                response = json.loads(sock.makefile('rb').readline())
+            sys.stdout.write(response['output'])
+            return response['exit_code']
+        except (OSError, ValueError, KeyError):
+            pass  # no server, or it timed out (socket.timeout) - validate in-process
+            
+    sys.argv[0] = VALIDATOR
+    runpy.run_path(VALIDATOR, run_name='__main__')  # exits via sys.exit(main())
+    return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,111 +4,314 @@ Pre-commit hook to validate deployment configuration
 Prevents deployment failures by validating configuration before commit
 """
 
+import argparse
+import contextlib
 import os
 import sys
 import json
+import mmap
+import functools
+import hashlib
+import io
 import yaml
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Sequence
+
+# Prefer the LibYAML-backed C loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# TOML parser: stdlib tomllib on Python 3.11+, tomli backport otherwise
+try:
+    import tomllib as _toml
+except ImportError:
+    try:
+        import tomli as _toml
+    except ImportError:
+        _toml = None
+
+# Precompiled patterns - compiled once at import instead of per file/line
+_REQUIRED_DOCKERFILE_INSTRUCTIONS = ('FROM', 'WORKDIR', 'COPY', 'RUN')
+_DOCKERFILE_INSTRUCTION_RE = re.compile(
+    rf'^({"|".join(_REQUIRED_DOCKERFILE_INSTRUCTIONS)})\s+'.encode(), re.MULTILINE | re.IGNORECASE
+)
+
+# Files at least this large are memory-mapped rather than read into memory
+_MMAP_THRESHOLD = 64 * 1024
+
+# Hardcoded secret patterns by kind. Each is searched separately so a
+# match of one kind cannot hide an overlapping match of another.
+_SECRET_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE) for name, pattern in (
+        ('password', r'password\s*[:=]\s*["\'][^"\']{8,}["\']'),
+        ('token', r'token\s*[:=]\s*["\'][^"\']{20,}["\']'),
+        ('key', r'key\s*[:=]\s*["\'][^"\']{10,}["\']'),
+        ('discord_webhook', r'discord\.com/api/webhooks/\d+/[a-zA-Z0-9_-]+')
+    )
+}
+_SECRET_COMMENT_RE = re.compile(r'#.*(?:PASSWORD|SECRET|TOKEN)', re.IGNORECASE)
+
+_GO_MOD_MODULE_RE = re.compile(r'^module\s+\S+', re.MULTILINE)
+_GO_MOD_VERSION_RE = re.compile(r'^go\s+(\d+\.\d+)', re.MULTILINE)
+
+# Matched against raw .env keys; IGNORECASE avoids an upper() copy per line
+_SENSITIVE_KEY_RE = re.compile(rb'PASSWORD|SECRET|KEY|TOKEN', re.IGNORECASE)
+
+# Matches requirements.txt lines that are neither blank, comments, nor a
+# plain `name[op version]` spec, so the whole file is scanned in one pass
+_REQ_SPEC = rb'[a-zA-Z0-9_-]+(?:[><=!~]+[\d.]+)?'
+_REQ_UNUSUAL_LINE_RE = re.compile(
+    rb'^(?![^\S\n]*(?:#.*|' + _REQ_SPEC + rb')?[^\S\n]*$).+$', re.MULTILINE
+)
+
+# On-disk cache of parsed YAML (as JSON) so unchanged files skip YAML parsing
+_YAML_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'sermon-uploader-validator'
+_YAML_CACHE_MAX_ENTRIES = 256
+
+def _yaml_cache_path(path: str) -> Path:
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return _YAML_CACHE_DIR / f"{digest}.json"
+
+def _to_json_safe(obj: Any) -> Any:
+    """Encode mappings with non-string keys (e.g. YAML's `on:` -> True) as item lists"""
+    if isinstance(obj, dict):
+        if all(isinstance(k, str) for k in obj):
+            return {k: _to_json_safe(v) for k, v in obj.items()}
+        return {'__items__': [[k, _to_json_safe(v)] for k, v in obj.items()]}
+    if isinstance(obj, list):
+        return [_to_json_safe(v) for v in obj]
+    return obj
+
+def _from_json_object(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and '__items__' in obj:
+        return {k: v for k, v in obj['__items__']}
+    return obj
+
+def _read_yaml_cache(key: tuple) -> Optional[Dict[str, Any]]:
+    """Return the cached entry for key, or None if missing or stale"""
+    try:
+        with open(_yaml_cache_path(key[0])) as f:
+            entry = json.load(f, object_hook=_from_json_object)
+    except (OSError, ValueError):
+        return None
+    if entry.get('mtime_ns') != key[1] or entry.get('size') != key[2]:
+        return None
+    return entry
+
+def _write_yaml_cache(key: tuple, data: Any):
+    """Store parsed YAML, skipping data that does not survive a JSON round-trip"""
+    try:
+        serialized = json.dumps({'mtime_ns': key[1], 'size': key[2], 'data': _to_json_safe(data)})
+        if json.loads(serialized, object_hook=_from_json_object)['data'] != data:
+            return  # e.g. dates or float keys - cache would change results
+        _YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = _yaml_cache_path(key[0])
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(serialized)
+        os.replace(tmp_path, cache_path)
+        _prune_yaml_cache()
+    except (OSError, TypeError, ValueError):
+        pass  # caching is best-effort
+
+def _prune_yaml_cache():
+    """Evict the least recently written entries once the cache grows too large"""
+    with os.scandir(_YAML_CACHE_DIR) as it:
+        entries = [e for e in it if e.name.endswith('.json')]
+    if len(entries) <= _YAML_CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime_ns)
+    for entry in entries[:len(entries) - _YAML_CACHE_MAX_ENTRIES]:
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+
+@functools.lru_cache(maxsize=None)
+def _list_dir(directory: str) -> Optional[Dict[str, os.DirEntry]]:
+    """Snapshot of a directory's entries by name (None if it does not exist)"""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def _exists(path: str) -> bool:
+    """Answer existence from the parent directory snapshot instead of a stat"""
+    directory, name = os.path.split(path)
+    entries = _list_dir(directory or '.')
+    return entries is not None and name in entries
+
+def _missing_keys(required: Sequence[str], present) -> List[str]:
+    """Required keys absent from present, in declared order"""
+    # One set difference covers the common all-present case
+    missing = set(required).difference(present)
+    if not missing:
+        return []
+    return [key for key in required if key in missing]
+
+@contextlib.contextmanager
+def _map_file(path):
+    """Yield a file's raw bytes, memory-mapped when large enough to pay off"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+def _file_key(path) -> tuple:
+    """Cache key that changes whenever the file content may have changed"""
+    st = os.stat(path)
+    return (os.fspath(path), st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=64)
+def _read_text_cached(key: tuple) -> str:
+    with open(key[0]) as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=64)
+def _parse_yaml_cached(key: tuple) -> Any:
+    entry = _read_yaml_cache(key)
+    if entry is not None:
+        return entry['data']
+    stream = io.StringIO(_read_text_cached(key))
+    stream.name = key[0]  # keep file names in YAML error messages
+    data = yaml.load(stream, Loader=_SafeLoader)
+    _write_yaml_cache(key, data)
+    return data
+
+def _read_text(path) -> str:
+    """Read a file, reusing the content if another validator already read it"""
+    return _read_text_cached(_file_key(path))
+
+def _load_yaml(path) -> Any:
+    """Parse a YAML file, reusing the parsed result across validator passes"""
+    return _parse_yaml_cached(_file_key(path))
+
+# Declarative workflow requirements. Every required workflow needs the
+# top-level fields; schemas add (section, required keys, severity, message)
+# checks for specific workflows.
+_REQUIRED_WORKFLOWS = (
+    'comprehensive-deployment.yml',
+    'runner-optimization.yml',
+    'emergency-rollback.yml'
+)
+
+_REQUIRED_WORKFLOW_FIELDS = {
+    'name': "Missing 'name' field",
+    'on': "Missing 'on' triggers",
+    'jobs': "Missing 'jobs' section"
+}
+
+_WORKFLOW_SCHEMAS = {
+    'comprehensive-deployment.yml': (
+        ('jobs', (
+            'detect-changes',
+            'pre-flight-security',
+            'syntax-validation',
+            'quality-gates',
+            'security-scan',
+            'docker-build',
+            'integration-tests',
+            'deploy-blue-green'
+        ), 'error', "Deployment workflow missing required job: {}"),
+        ('env', (
+            'MIN_GO_COVERAGE',
+            'MIN_JS_COVERAGE',
+            'MAX_CRITICAL_VULNS',
+            'MAX_BUILD_TIME'
+        ), 'warning', "Missing quality threshold: {}")
+    ),
+    'emergency-rollback.yml': (
+        ('jobs', (
+            'emergency-assessment',
+            'execute-rollback',
+            'verify-rollback'
+        ), 'error', "Rollback workflow missing required job: {}"),
+    )
+}
+
+# Path prefixes each validation step is responsible for. Steps whose
+# prefixes match none of the staged files are skipped.
+_WORKFLOW_PATHS = ('.github/workflows/',)
+_DOCKER_PATHS = ('Dockerfile', 'docker-compose', 'pi-processor/Dockerfile')
+_ENV_PATHS = ('backend/.env', 'frontend/.env', 'pi-processor/.env')
+_DEPENDENCY_PATHS = (
+    'backend/go.mod',
+    'frontend/package.json',
+    'pi-processor/requirements.txt',
+    'pi-processor/pyproject.toml'
+)
 
 class DeploymentConfigValidator:
-    def __init__(self):
+    def __init__(self, staged_files: Optional[List[str]] = None, fail_fast: bool = False):
         self.errors = []
         self.warnings = []
+        self.fail_fast = fail_fast
+        self.steps_run = 0
+        # None means "validate everything" (no file list was given). Paths are
+        # made relative to the repo root (cwd) so absolute paths still match.
+        self.staged_files = (
+            None if staged_files is None
+            else {os.path.relpath(os.path.abspath(p)).replace(os.sep, '/') for p in staged_files}
+        )
+        
+    def _is_relevant(self, prefixes: tuple) -> bool:
+        """Whether any staged file falls under the given path prefixes"""
+        if self.staged_files is None:
+            return True
+        return any(path.startswith(prefixes) for path in self.staged_files)
+        
+    def _validate_if_present(self, file_path: str, validate: Callable[[str], None]) -> bool:
+        """Run validate(file_path) if the file exists; return False if it is missing"""
+        if not _exists(file_path):
+            return False
+        try:
+            validate(file_path)
+        except FileNotFoundError:  # removed since the snapshot was taken
+            return False
+        return True
         
     def validate_github_workflows(self) -> bool:
         """Validate GitHub workflow files"""
         workflows_dir = Path('.github/workflows')
-        if not workflows_dir.exists():
+        present = _list_dir('.github/workflows')
+        if present is None:
             self.errors.append("No .github/workflows directory found")
             return False
             
-        required_workflows = [
-            'comprehensive-deployment.yml',
-            'runner-optimization.yml', 
-            'emergency-rollback.yml'
-        ]
-        
-        for workflow in required_workflows:
-            workflow_path = workflows_dir / workflow
-            if not workflow_path.exists():
-                self.errors.append(f"Missing required workflow: {workflow}")
-                continue
-                
-            try:
-                with open(workflow_path) as f:
-                    workflow_content = yaml.safe_load(f)
-                    self._validate_workflow_structure(workflow, workflow_content)
-            except yaml.YAMLError as e:
-                self.errors.append(f"Invalid YAML in {workflow}: {e}")
-            except Exception as e:
-                self.errors.append(f"Error reading {workflow}: {e}")
-                
+        for workflow in _REQUIRED_WORKFLOWS:
+            self._check_required_workflow(workflows_dir, workflow, present)
+            
         return len(self.errors) == 0
         
-    def _validate_workflow_structure(self, workflow_name: str, content: Dict[str, Any]):
-        """Validate individual workflow structure"""
-        if 'name' not in content:
-            self.errors.append(f"{workflow_name}: Missing 'name' field")
-            
-        if 'on' not in content:
-            self.errors.append(f"{workflow_name}: Missing 'on' triggers")
+    def _check_required_workflow(self, workflows_dir: Path, workflow: str, present: Dict[str, os.DirEntry]):
+        """Validate a single required workflow file"""
+        if workflow not in present:
+            self.errors.append(f"Missing required workflow: {workflow}")
+            return
             
-        if 'jobs' not in content:
-            self.errors.append(f"{workflow_name}: Missing 'jobs' section")
+        try:
+            workflow_content = _load_yaml(workflows_dir / workflow)
+            self._validate_workflow_structure(workflow, workflow_content)
+        except yaml.YAMLError as e:
+            self.errors.append(f"Invalid YAML in {workflow}: {e}")
+        except Exception as e:
+            self.errors.append(f"Error reading {workflow}: {e}")
+        
+    def _validate_workflow_structure(self, workflow_name: str, content: Dict[str, Any]):
+        """Validate individual workflow structure against its schema"""
+        for field in _missing_keys(list(_REQUIRED_WORKFLOW_FIELDS), content):
+            self.errors.append(f"{workflow_name}: {_REQUIRED_WORKFLOW_FIELDS[field]}")
             
         # Validate specific workflow requirements
-        if workflow_name == 'comprehensive-deployment.yml':
-            self._validate_deployment_workflow(content)
-        elif workflow_name == 'emergency-rollback.yml':
-            self._validate_rollback_workflow(content)
-            
-    def _validate_deployment_workflow(self, content: Dict[str, Any]):
-        """Validate deployment workflow specific requirements"""
-        jobs = content.get('jobs', {})
-        
-        required_jobs = [
-            'detect-changes',
-            'pre-flight-security', 
-            'syntax-validation',
-            'quality-gates',
-            'security-scan',
-            'docker-build',
-            'integration-tests',
-            'deploy-blue-green'
-        ]
-        
-        for job in required_jobs:
-            if job not in jobs:
-                self.errors.append(f"Deployment workflow missing required job: {job}")
-                
-        # Check for quality thresholds
-        env_vars = content.get('env', {})
-        required_thresholds = [
-            'MIN_GO_COVERAGE',
-            'MIN_JS_COVERAGE', 
-            'MAX_CRITICAL_VULNS',
-            'MAX_BUILD_TIME'
-        ]
-        
-        for threshold in required_thresholds:
-            if threshold not in env_vars:
-                self.warnings.append(f"Missing quality threshold: {threshold}")
-                
-    def _validate_rollback_workflow(self, content: Dict[str, Any]):
-        """Validate rollback workflow requirements"""
-        jobs = content.get('jobs', {})
-        
-        required_jobs = [
-            'emergency-assessment',
-            'execute-rollback',
-            'verify-rollback'
-        ]
-        
-        for job in required_jobs:
-            if job not in jobs:
-                self.errors.append(f"Rollback workflow missing required job: {job}")
+        for section, required_keys, severity, message in _WORKFLOW_SCHEMAS.get(workflow_name, ()):
+            report = self.errors if severity == 'error' else self.warnings
+            for key in _missing_keys(required_keys, content.get(section, {})):
+                report.append(message.format(key))
                 
     def validate_docker_configs(self) -> bool:
         """Validate Docker configuration files"""
@@ -119,25 +322,27 @@ class DeploymentConfigValidator:
         ]
         
         for docker_file in docker_files:
-            if not os.path.exists(docker_file):
-                if 'single' in docker_file:
-                    self.warnings.append(f"Docker config not found: {docker_file}")
-                else:
-                    self.errors.append(f"Required Docker config missing: {docker_file}")
-                continue
-                    
-            if docker_file.endswith('.yml'):
-                self._validate_docker_compose(docker_file)
-            else:
-                self._validate_dockerfile(docker_file)
-                
+            self._check_docker_config(docker_file)
+            
         return len(self.errors) == 0
         
+    def _check_docker_config(self, docker_file: str):
+        """Validate a single Docker config, reporting it if missing"""
+        if docker_file.endswith('.yml'):
+            validate = self._validate_docker_compose
+        else:
+            validate = self._validate_dockerfile
+            
+        if not self._validate_if_present(docker_file, validate):
+            if 'single' in docker_file:
+                self.warnings.append(f"Docker config not found: {docker_file}")
+            else:
+                self.errors.append(f"Required Docker config missing: {docker_file}")
+        
     def _validate_docker_compose(self, file_path: str):
         """Validate docker-compose file"""
         try:
-            with open(file_path) as f:
-                compose_content = yaml.safe_load(f)
+            compose_content = _load_yaml(file_path)
                 
             # Check for required services
             services = compose_content.get('services', {})
@@ -154,6 +359,8 @@ class DeploymentConfigValidator:
                 if service_name in ['sermon-uploader', 'minio'] and 'healthcheck' not in service_config:
                     self.warnings.append(f"{file_path}: Service {service_name} missing healthcheck")
                     
+        except FileNotFoundError:
+            raise
         except yaml.YAMLError as e:
             self.errors.append(f"{file_path}: Invalid YAML - {e}")
         except Exception as e:
@@ -162,23 +369,34 @@ class DeploymentConfigValidator:
     def _validate_dockerfile(self, file_path: str):
         """Validate Dockerfile"""
         try:
-            with open(file_path) as f:
-                dockerfile_content = f.read()
-                
-            # Check for required instructions
-            required_instructions = ['FROM', 'WORKDIR', 'COPY', 'RUN']
-            for instruction in required_instructions:
-                if not re.search(rf'^{instruction}\s+', dockerfile_content, re.MULTILINE | re.IGNORECASE):
-                    self.warnings.append(f"{file_path}: Missing {instruction} instruction")
-                    
-            # Check for security best practices
-            if 'USER root' in dockerfile_content and 'USER ' not in dockerfile_content.split('USER root')[1]:
-                self.warnings.append(f"{file_path}: Running as root user - consider using non-root user")
-                
-            # Check for health check
-            if 'HEALTHCHECK' not in dockerfile_content:
-                self.warnings.append(f"{file_path}: Missing HEALTHCHECK instruction")
+            # Scanned as raw bytes - no decode, and no copy for large files
+            with _map_file(file_path) as dockerfile_content:
+                # Check for required instructions (single pass over the file)
+                seen = {
+                    m.group(1).upper().decode()
+                    for m in _DOCKERFILE_INSTRUCTION_RE.finditer(dockerfile_content)
+                }
+                for instruction in _REQUIRED_DOCKERFILE_INSTRUCTIONS:
+                    if instruction not in seen:
+                        self.warnings.append(f"{file_path}: Missing {instruction} instruction")
+                        
+                # Check for security best practices: no USER switch between the
+                # first 'USER root' and the next one (or end of file)
+                root_idx = dockerfile_content.find(b'USER root')
+                if root_idx != -1:
+                    start = root_idx + len(b'USER root')
+                    end = dockerfile_content.find(b'USER root', start)
+                    if end == -1:
+                        end = len(dockerfile_content)
+                    if dockerfile_content.find(b'USER ', start, end) == -1:
+                        self.warnings.append(f"{file_path}: Running as root user - consider using non-root user")
+                        
+                # Check for health check
+                if dockerfile_content.find(b'HEALTHCHECK') == -1:
+                    self.warnings.append(f"{file_path}: Missing HEALTHCHECK instruction")
                 
+        except FileNotFoundError:
+            raise
         except Exception as e:
             self.errors.append(f"{file_path}: Error reading Dockerfile - {e}")
             
@@ -188,9 +406,7 @@ class DeploymentConfigValidator:
         
         for component in components:
             env_example = f"{component}/.env.example"
-            if os.path.exists(env_example):
-                self._validate_env_file(env_example)
-            else:
+            if not self._validate_if_present(env_example, self._validate_env_file):
                 if component != 'frontend':  # Frontend .env is optional
                     self.warnings.append(f"Missing environment example file: {env_example}")
                     
@@ -199,63 +415,67 @@ class DeploymentConfigValidator:
     def _validate_env_file(self, file_path: str):
         """Validate .env file format"""
         try:
-            with open(file_path) as f:
-                lines = f.readlines()
-                
+            # Raw lines split on \n, \r\n or lone \r like text mode; only lines
+            # that get reported are decoded
+            with open(file_path, 'rb') as f:
+                lines = f.read().splitlines()
             for line_num, line in enumerate(lines, 1):
                 line = line.strip()
-                if not line or line.startswith('#'):
+                if not line or line.startswith(b'#'):
                     continue
                     
-                if '=' not in line:
-                    self.errors.append(f"{file_path}:{line_num}: Invalid env var format: {line}")
+                if b'=' not in line:
+                    self.errors.append(f"{file_path}:{line_num}: Invalid env var format: {line.decode()}")
                     continue
                     
-                key, value = line.split('=', 1)
+                key, value = line.split(b'=', 1)
                 
                 # Check for common security issues
-                if any(sensitive in key.upper() for sensitive in ['PASSWORD', 'SECRET', 'KEY', 'TOKEN']):
-                    if not value.startswith('your_') and not value.startswith('${') and len(value) > 10:
+                if _SENSITIVE_KEY_RE.search(key):
+                    if not value.startswith((b'your_', b'${')) and len(value.decode()) > 10:
                         self.warnings.append(f"{file_path}:{line_num}: Possible hardcoded secret in example file")
-                        
+                    
+        except FileNotFoundError:
+            raise
         except Exception as e:
             self.errors.append(f"{file_path}: Error reading env file - {e}")
             
     def validate_secret_usage(self) -> bool:
         """Validate proper secret usage in workflows"""
-        workflows_dir = Path('.github/workflows')
+        workflow_files = [
+            entry for entry in (_list_dir('.github/workflows') or {}).values()
+            if entry.name.endswith(('.yml', '.yaml')) and entry.is_file()
+        ]
         
-        for workflow_file in workflows_dir.glob('*.yml'):
-            try:
-                with open(workflow_file) as f:
-                    content = f.read()
-                    
-                # Check for hardcoded secrets
-                secret_patterns = [
-                    r'password\s*[:=]\s*["\'][^"\']{8,}["\']',
-                    r'token\s*[:=]\s*["\'][^"\']{20,}["\']',
-                    r'key\s*[:=]\s*["\'][^"\']{10,}["\']',
-                    r'discord\.com/api/webhooks/\d+/[a-zA-Z0-9_-]+'
-                ]
+        for workflow_file in workflow_files:
+            self._check_workflow_secrets(workflow_file)
+            
+        return len(self.errors) == 0
+        
+    def _check_workflow_secrets(self, workflow_file: os.DirEntry):
+        """Scan a single workflow file for hardcoded secrets"""
+        try:
+            content = _read_text(workflow_file)
                 
-                for pattern in secret_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    if matches:
-                        self.errors.append(f"{workflow_file.name}: Found hardcoded secrets - use GitHub Secrets instead")
-                        
-                # Check for proper secret usage
-                if '${{ secrets.' in content:
-                    # Good - using GitHub Secrets
-                    pass
-                elif any(sensitive in content.upper() for sensitive in ['PASSWORD', 'SECRET_KEY', 'TOKEN']):
+            # Check for hardcoded secrets
+            for name, pattern in _SECRET_PATTERNS.items():
+                if pattern.search(content):
+                    kind = name.replace('_', ' ')
+                    self.errors.append(f"{workflow_file.name}: Found hardcoded secrets ({kind}) - use GitHub Secrets instead")
+                    
+            # Check for proper secret usage
+            if '${{ secrets.' in content:
+                # Good - using GitHub Secrets
+                pass
+            else:
+                upper_content = content.upper()  # once, not per keyword
+                if any(sensitive in upper_content for sensitive in ['PASSWORD', 'SECRET_KEY', 'TOKEN']):
                     # Check if it's in a comment or example
-                    if not re.search(r'#.*(?:PASSWORD|SECRET|TOKEN)', content, re.IGNORECASE):
+                    if not _SECRET_COMMENT_RE.search(content):
                         self.warnings.append(f"{workflow_file.name}: Consider using GitHub Secrets for sensitive data")
-                        
-            except Exception as e:
-                self.errors.append(f"{workflow_file.name}: Error validating secrets - {e}")
-                
-        return len(self.errors) == 0
+                    
+        except Exception as e:
+            self.errors.append(f"{workflow_file.name}: Error validating secrets - {e}")
         
     def validate_dependency_files(self) -> bool:
         """Validate dependency management files"""
@@ -267,11 +487,10 @@ class DeploymentConfigValidator:
         }
         
         for file_path, validator in dependency_files.items():
-            if os.path.exists(file_path):
-                try:
-                    validator(file_path)
-                except Exception as e:
-                    self.errors.append(f"{file_path}: Validation error - {e}")
+            try:
+                self._validate_if_present(file_path, validator)  # optional files
+            except Exception as e:
+                self.errors.append(f"{file_path}: Validation error - {e}")
                     
         return len(self.errors) == 0
         
@@ -280,14 +499,14 @@ class DeploymentConfigValidator:
         with open(file_path) as f:
             content = f.read()
             
-        if not re.search(r'^module\s+\S+', content, re.MULTILINE):
+        if not _GO_MOD_MODULE_RE.search(content):
             self.errors.append(f"{file_path}: Missing module declaration")
             
-        if not re.search(r'^go\s+\d+\.\d+', content, re.MULTILINE):
+        go_version_match = _GO_MOD_VERSION_RE.search(content)
+        if not go_version_match:
             self.errors.append(f"{file_path}: Missing Go version")
             
         # Check for minimum Go version
-        go_version_match = re.search(r'^go\s+(\d+\.\d+)', content, re.MULTILINE)
         if go_version_match:
             version = float(go_version_match.group(1))
             if version < 1.21:
@@ -312,52 +531,64 @@ class DeploymentConfigValidator:
                 
     def _validate_requirements_txt(self, file_path: str):
         """Validate requirements.txt file"""
-        with open(file_path) as f:
-            lines = f.readlines()
+        with open(file_path, 'rb') as f:
+            # Universal newlines, as text mode would give: lone \r ends a line too
+            content = f.read().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
             
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            # Basic format check
-            if not re.match(r'^[a-zA-Z0-9_-]+([><=!~]+[\d.]+)?$', line):
-                if '/' not in line and 'git+' not in line:  # Allow git dependencies
-                    self.warnings.append(f"{file_path}:{line_num}: Unusual dependency format: {line}")
+        # Basic format check - only unusual lines reach Python code
+        line_num, pos = 1, 0
+        for match in _REQ_UNUSUAL_LINE_RE.finditer(content):
+            line_num += content.count(b'\n', pos, match.start())
+            pos = match.start()
+            line = match.group().strip()
+            if b'/' not in line and b'git+' not in line:  # Allow git dependencies
+                self.warnings.append(f"{file_path}:{line_num}: Unusual dependency format: {line.decode()}")
                     
     def _validate_pyproject_toml(self, file_path: str):
         """Validate pyproject.toml file"""
+        if _toml is None:
+            self.warnings.append(f"{file_path}: Cannot validate - tomllib/tomli not available")
+            return
+            
         try:
-            import tomli
             with open(file_path, 'rb') as f:
-                pyproject_data = tomli.load(f)
+                pyproject_data = _toml.load(f)
                 
             if 'project' not in pyproject_data and 'tool' not in pyproject_data:
                 self.warnings.append(f"{file_path}: Missing project or tool configuration")
                 
-        except ImportError:
-            self.warnings.append(f"{file_path}: Cannot validate - tomli not available")
+        except FileNotFoundError:
+            raise
         except Exception as e:
             self.errors.append(f"{file_path}: Invalid TOML format - {e}")
             
     def run_validation(self) -> bool:
         """Run all validation checks"""
         print("🔍 Validating deployment configuration...")
+        _list_dir.cache_clear()  # fresh filesystem snapshot for this run
         
         validation_steps = [
-            ("GitHub Workflows", self.validate_github_workflows),
-            ("Docker Configurations", self.validate_docker_configs),
-            ("Environment Configs", self.validate_environment_configs),
-            ("Secret Usage", self.validate_secret_usage),
-            ("Dependency Files", self.validate_dependency_files)
+            ("GitHub Workflows", self.validate_github_workflows, _WORKFLOW_PATHS),
+            ("Docker Configurations", self.validate_docker_configs, _DOCKER_PATHS),
+            ("Environment Configs", self.validate_environment_configs, _ENV_PATHS),
+            ("Secret Usage", self.validate_secret_usage, _WORKFLOW_PATHS),
+            ("Dependency Files", self.validate_dependency_files, _DEPENDENCY_PATHS)
         ]
         
         all_passed = True
-        for step_name, validator in validation_steps:
+        for step_name, validator, paths in validation_steps:
+            if not self._is_relevant(paths):
+                print(f"  Skipping {step_name} (no relevant files staged)")
+                continue
             print(f"  Checking {step_name}...")
+            self.steps_run += 1
             if not validator():
                 all_passed = False
                 
+            if self.fail_fast and self.errors:
+                print("  Stopping at first failing step (--fail-fast)")
+                return False
+                
         return all_passed
         
     def print_results(self):
@@ -372,7 +603,9 @@ class DeploymentConfigValidator:
             for warning in self.warnings:
                 print(f"   • {warning}")
                 
-        if not self.errors and not self.warnings:
+        if self.staged_files is not None and self.steps_run == 0:
+            print(f"\nℹ️  None of the {len(self.staged_files)} given files are deployment configuration - nothing was validated")
+        elif not self.errors and not self.warnings:
             print("\n✅ All deployment configuration checks passed!")
         elif not self.errors:
             print(f"\n✅ Validation passed with {len(self.warnings)} warnings")
@@ -381,8 +614,10 @@ class DeploymentConfigValidator:
 
 def main():
     """Main entry point"""
-    if len(sys.argv) > 1 and sys.argv[1] == '--help':
-        print("""
+    parser = argparse.ArgumentParser(
+        prog='validate-deployment-config.py',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=r"""
 Deployment Configuration Validator
 
 This hook validates deployment configuration files to prevent failures:
@@ -392,18 +627,42 @@ This hook validates deployment configuration files to prevent failures:
 - Dependency management files (go.mod, package.json, requirements.txt)
 - Secret usage patterns
 
-Usage:
-  python validate-deployment-config.py [--help]
+When FILE arguments are given (as pre-commit passes staged files), only
+the checks covering those paths are run. To have pre-commit invoke the
+hook only when relevant files change, use a filter such as:
+  files: ^(\.github/workflows/|Dockerfile|docker-compose|pi-processor/|backend/(\.env|go\.mod)|frontend/(\.env|package\.json))
 
+To avoid paying interpreter and PyYAML start-up on every commit, start a
+long-running server with --serve and point the hook at
+validate-deployment-config-client.py instead; the client runs the
+validator in-process whenever no server is listening.
+
+Requires PyYAML; YAML parsing uses the faster LibYAML C loader when
+PyYAML was built against libyaml (e.g. apt install libyaml-dev).
+""",
+        epilog="""
 Exit codes:
   0 - All validations passed
   1 - Validation errors found (will block commit)
   2 - Only warnings found (commit allowed)
-""")
-        return 0
-        
-    validator = DeploymentConfigValidator()
+"""
+    )
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help='staged files to validate (default: validate everything)')
+    parser.add_argument('--fail-fast', '--fast', action='store_true',
+                        help='stop after the first validation step that reports errors')
+    parser.add_argument('--serve', action='store_true',
+                        help='run as a daemon answering validate-deployment-config-client.py requests')
+    args = parser.parse_args()
     
+    if args.serve:
+        return serve(_socket_path())
+        
+    validator = DeploymentConfigValidator(args.files or None, fail_fast=args.fail_fast)
+    return run_hook(validator)
+
+def run_hook(validator: DeploymentConfigValidator) -> int:
+    """Run validation, print the report and return the hook exit code"""
     try:
         validation_passed = validator.run_validation()
         validator.print_results()
@@ -422,5 +681,103 @@ Exit codes:
         print(f"\n💥 Validation failed with unexpected error: {e}")
         return 1
 
+# Seconds the server waits for a client to send its request; a client that
+# connects and stays silent must not block the single-threaded server
+_REQUEST_TIMEOUT = 2
+
+def _socket_path() -> str:
+    """Unix socket shared by --serve and validate-deployment-config-client.py"""
+    import tempfile  # only needed for --serve; keeps normal hook start-up lean
+    
+    # Per-user name: the temp dir fallback is shared with other users
+    return os.path.join(
+        os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(),
+        f'sermon-validator-{os.getuid()}.sock'
+    )
+
+def _clear_caches():
+    _read_text_cached.cache_clear()
+    _parse_yaml_cached.cache_clear()
+    _list_dir.cache_clear()
+
+def serve(socket_path: str) -> int:
+    """Answer validation requests over a unix socket, keeping imports and caches warm"""
+    # Protocol: one JSON request line {"cwd", "files", "fail_fast"}, answered
+    # with one JSON line {"exit_code", "output", "errors", "warnings"}
+    import socket  # only needed for --serve; keeps normal hook start-up lean
+    
+    if os.path.lexists(socket_path):
+        if os.lstat(socket_path).st_uid != os.getuid():
+            print(f"❌ {socket_path} belongs to another user - refusing to use it")
+            return 1
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+                print(f"❌ A validation server is already listening on {socket_path}")
+                return 1
+            except OSError:
+                pass
+        try:
+            os.unlink(socket_path)  # stale socket from a previous server
+        except OSError as e:
+            print(f"❌ Cannot remove stale socket {socket_path}: {e}")
+            return 1
+                
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket is only usable by the current user
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    print(f"🛰️  Serving validation requests on {socket_path}")
+    
+    last_cwd = None
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(_REQUEST_TIMEOUT)
+                try:
+                    request = json.loads(conn.makefile('rb').readline())
+                    if request['cwd'] != last_cwd:
+                        # Cache keys use repo-relative paths
+                        _clear_caches()
+                        last_cwd = request['cwd']
+                    os.chdir(request['cwd'])
+                    
+                    validator = DeploymentConfigValidator(
+                        request.get('files') or None, fail_fast=request.get('fail_fast', False)
+                    )
+                    output = io.StringIO()
+                    with contextlib.redirect_stdout(output):
+                        exit_code = run_hook(validator)
+                    response = {
+                        'exit_code': exit_code,
+                        'output': output.getvalue(),
+                        'errors': validator.errors,
+                        'warnings': validator.warnings
+                    }
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    response = {
+                        'exit_code': 1,
+                        'output': f"\n💥 Validation failed with unexpected error: {e}\n",
+                        'errors': [str(e)],
+                        'warnings': []
+                    }
+                    
+                try:
+                    conn.sendall(json.dumps(response).encode() + b'\n')
+                except OSError:
+                    pass  # client went away
+    except KeyboardInterrupt:
+        print("\n⏹️  Validation server stopped")
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+            
+    return 0
+
 if __name__ == '__main__':
     sys.exit(main())
\ No newline at end of file